@@ -8,16 +8,19 @@
 # For a full project structure, it is accompanied by:
 # - README.md: A project description, installation, and usage instructions.
 # - requirements.txt: To list dependencies like PyQt5.
+# - styles.qss: The dark theme stylesheet applied at startup.
 # - LICENSE.txt: To specify the terms of use (e.g., MIT License).
 #
 
 import sys
 import os
 import datetime
+import functools
+import mmap
 import urllib.parse
-from PyQt5.QtCore import QUrl, Qt, QSize
-from PyQt5.QtWidgets import QApplication, QMainWindow, QToolBar, QAction, QLineEdit, QTabWidget, QVBoxLayout, QWidget, QDialog, QPushButton, QListWidget, QListWidgetItem, QHBoxLayout, QMessageBox, QLabel, QStatusBar, QProgressBar, QFileDialog
-from PyQt5.QtWebEngineWidgets import QWebEngineView
+from PyQt5.QtCore import QUrl, Qt, QSize, QTimer, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QMainWindow, QToolBar, QAction, QLineEdit, QTabWidget, QVBoxLayout, QWidget, QDialog, QPushButton, QListView, QHBoxLayout, QMessageBox, QLabel, QStatusBar, QProgressBar, QFileDialog
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineProfile
 from PyQt5.QtGui import QIcon, QGuiApplication
 from PyQt5.Qt import QDesktopServices
 from PyQt5.QtCore import QT_VERSION_STR
@@ -26,10 +29,13 @@ from PyQt5.QtCore import QT_VERSION_STR
 # --- Application Data Path Helper ---
 # This function creates and returns a platform-appropriate directory for
 # application data, ensuring files like bookmarks.txt are stored reliably.
+@functools.lru_cache(maxsize=1)
 def get_data_path():
     """
     Returns the path to the application's data directory.
     Creates the directory if it does not exist.
+    The result is cached, so the existence check and directory creation
+    only happen on the first call.
     """
     # Use a hidden directory in the user's home folder for cross-platform compatibility
     app_data_dir = os.path.join(os.path.expanduser("~"), ".my_advanced_browser")
@@ -37,6 +43,142 @@ def get_data_path():
         os.makedirs(app_data_dir)
     return app_data_dir
 
+# The bookmarks file path never changes during a run, so compute it once
+# instead of rebuilding it on every bookmark operation.
+BOOKMARKS_PATH = os.path.join(get_data_path(), "bookmarks.txt")
+
+# The dark theme stylesheet ships as a plain .qss file next to this script.
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.qss")
+
+
+def load_stylesheet():
+    """
+    Reads the application stylesheet from styles.qss.
+    Returns an empty string (Qt defaults) if the file is missing.
+    """
+    try:
+        with open(STYLESHEET_PATH, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+# Bookmarks files larger than this are parsed through mmap, so the parse
+# works on the mapped region instead of copying the whole file into a
+# Python string. Smaller files are not worth the mapping setup cost.
+MMAP_THRESHOLD = 64 * 1024
+
+# Template for the About dialog. Everything that cannot change during a
+# run (CSS, platform, Python and Qt versions) is baked in at import time;
+# only the clock fields are substituted when the dialog opens.
+_ABOUT_TEMPLATE = f"""
+<html>
+<head>
+    <style>
+        body {{{{ font-family: sans-serif; background-color: #333; color: #eee; }}}}
+        h3 {{{{ color: #007bff; }}}}
+        p {{{{ margin: 5px 0; }}}}
+        b {{{{ color: #ccc; }}}}
+    </style>
+</head>
+<body>
+    <h3>My Advanced Browser</h3>
+    <p>Version: 1.0.0</p>
+    <p>A simple, functional web browser built with PyQt5 and QtWebEngine.</p>
+    <p><b>Current Time:</b> {{time}} {{tz}}</p>
+    <p><b>Current Date:</b> {{date}}</p>
+    <p><b>System:</b> {sys.platform}</p>
+    <p><b>Python Version:</b> {sys.version.split()[0]}</p>
+    <p><b>Qt Version:</b> {QT_VERSION_STR}</p>
+</body>
+</html>
+"""
+
+# --- Background Bookmark I/O ---
+# Bookmark file operations run off the UI thread so slow storage (e.g. a
+# network home directory) cannot freeze the interface. Loads use the
+# global pool; writes go through a single-threaded pool so they reach the
+# disk in the order they were queued.
+class BookmarkLoader(QRunnable):
+    class Signals(QObject):
+        loaded = pyqtSignal(list)
+
+    def __init__(self, read_func):
+        super(BookmarkLoader, self).__init__()
+        self.signals = BookmarkLoader.Signals()
+        self._read = read_func
+
+    def run(self):
+        # The signal is delivered to the UI thread as a queued connection
+        self.signals.loaded.emit(self._read())
+
+
+class BookmarkWriter(QRunnable):
+    def __init__(self, mode, data):
+        super(BookmarkWriter, self).__init__()
+        self._mode = mode
+        self._data = data
+
+    def run(self):
+        with open(BOOKMARKS_PATH, self._mode, encoding="utf-8") as f:
+            f.write(self._data)
+
+
+# --- Bookmark Model Class ---
+# A lightweight list model over the in-memory (name, url) bookmark list.
+# Unlike QListWidget there is no per-row item object; the view pulls names
+# and URLs straight out of the list on demand.
+class BookmarkModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super(BookmarkModel, self).__init__(parent)
+        self._bookmarks = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._bookmarks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._bookmarks)):
+            return None
+        name, url = self._bookmarks[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.UserRole:
+            return url
+        return None
+
+    def bookmarks(self):
+        """
+        Returns the underlying list of (name, url) tuples.
+        """
+        return self._bookmarks
+
+    def reset_bookmarks(self, pairs):
+        """
+        Replaces the whole bookmark list in one model reset.
+        """
+        self.beginResetModel()
+        self._bookmarks = list(pairs)
+        self.endResetModel()
+
+    def append_bookmarks(self, pairs):
+        """
+        Appends (name, url) tuples, notifying the view of just the new rows.
+        """
+        if not pairs:
+            return
+        first = len(self._bookmarks)
+        self.beginInsertRows(QModelIndex(), first, first + len(pairs) - 1)
+        self._bookmarks.extend(pairs)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """
+        Removes a single bookmark by row.
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._bookmarks[row]
+        self.endRemoveRows()
+
+
 # --- Bookmark Manager Class ---
 # A dialog to manage and interact with saved bookmarks.
 class BookmarkManager(QDialog):
@@ -47,8 +189,26 @@ class BookmarkManager(QDialog):
         self.setObjectName("BookmarkManager")
 
         self.layout = QVBoxLayout()
-        self.bookmark_list = QListWidget()
+
+        # Incremental filter box; the proxy model applies the predicate in
+        # C rather than iterating items in Python per keystroke.
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setObjectName("BookmarkFilter")
+        self.filter_edit.setPlaceholderText("Filter bookmarks...")
+        self.layout.addWidget(self.filter_edit)
+
+        self.model = BookmarkModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.filter_edit.textChanged.connect(self.proxy.setFilterFixedString)
+
+        self.bookmark_list = QListView()
         self.bookmark_list.setObjectName("BookmarkList")
+        # All rows are one line of text; letting the view assume a uniform
+        # height keeps painting and scrolling cheap for large lists.
+        self.bookmark_list.setUniformItemSizes(True)
+        self.bookmark_list.setModel(self.proxy)
         self.layout.addWidget(self.bookmark_list)
 
         self.button_layout = QHBoxLayout()
@@ -65,88 +225,174 @@ class BookmarkManager(QDialog):
         self.layout.addLayout(self.button_layout)
         self.setLayout(self.layout)
 
+        # The model holds the authoritative in-memory (name, url) list;
+        # the URL set makes duplicate checks O(1) membership tests
+        # instead of a full file scan. Both are kept in sync with the file.
+        self._url_set = set()
+
+        # A single writer thread keeps queued file writes ordered
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+
+        # The file is read once per process; after that the in-memory
+        # model is authoritative and mutations keep it (and the disk)
+        # current, so reopening the dialog never re-reads the file.
+        # _load_scheduled means the async read has been queued;
+        # _load_complete means the model actually holds the file contents.
+        self._load_scheduled = False
+        self._load_complete = False
+
         # Load bookmarks on initialization
         self.load_bookmarks()
 
-    def load_bookmarks(self):
+    def _read_bookmark_pairs(self):
         """
-        Loads bookmarks from the bookmarks file and populates the list widget.
+        Reads and parses the bookmarks file, returning a list of
+        (name, url) tuples. Large files are memory-mapped so the parse
+        works directly on the mapped bytes; small ones are read in one go
+        and split in C, avoiding per-line handle iteration either way.
         """
-        self.bookmark_list.clear()
-        bookmarks_file_path = os.path.join(get_data_path(), "bookmarks.txt")
+        pairs = []
         try:
-            with open(bookmarks_file_path, "r") as f:
-                for line in f:
-                    parts = line.strip().split("|||")
-                    if len(parts) == 2:
-                        name, url = parts
-                        item = QListWidgetItem(name)
-                        item.setData(Qt.UserRole, url)
-                        self.bookmark_list.addItem(item)
+            if os.path.getsize(BOOKMARKS_PATH) > MMAP_THRESHOLD:
+                with open(BOOKMARKS_PATH, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for line in iter(mm.readline, b""):
+                            # partition stops at the first separator and
+                            # returns a fixed 3-tuple, unlike split.
+                            # Strip \r too: the writers use text mode, so
+                            # the file has CRLF endings on Windows.
+                            name, sep, url = line.rstrip(b"\r\n").partition(b"|||")
+                            if sep and url:
+                                # Decode only the lines that are kept;
+                                # "replace" keeps a bad line from killing
+                                # the loader thread.
+                                pairs.append((name.decode("utf-8", "replace"),
+                                              url.decode("utf-8", "replace")))
+            else:
+                with open(BOOKMARKS_PATH, "r", encoding="utf-8", errors="replace") as f:
+                    raw = f.read()
+                for line in raw.splitlines():
+                    name, sep, url = line.partition("|||")
+                    if sep and url:
+                        pairs.append((name, url))
         except FileNotFoundError:
             # File doesn't exist yet, which is fine for the first run
             pass
+        return pairs
+
+    def load_bookmarks(self):
+        """
+        Ensures the bookmarks are loaded. The first call kicks off an
+        asynchronous read of the bookmarks file and the model is
+        repopulated on the UI thread once parsing finishes; subsequent
+        calls are no-ops because the in-memory model stays authoritative.
+        """
+        if self._load_scheduled:
+            return
+        self._load_scheduled = True
+        loader = BookmarkLoader(self._read_bookmark_pairs)
+        loader.signals.loaded.connect(self._on_bookmarks_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_bookmarks_loaded(self, pairs):
+        """
+        Populates the model from parsed (name, url) tuples. A result that
+        arrives from the loader thread after _ensure_loaded has already
+        populated the model is stale — the model has since been mutated —
+        and must not clobber it.
+        """
+        if self._load_complete:
+            return
+        self._load_complete = True
+        self.model.reset_bookmarks(pairs)
+        self._url_set = {url for _, url in pairs}
+
+    def _ensure_loaded(self):
+        """
+        Forces the initial load to complete synchronously. Mutations call
+        this first so they validate and apply against the real file
+        contents rather than an empty model while the asynchronous read
+        is still in flight.
+        """
+        if not self._load_complete:
+            self._on_bookmarks_loaded(self._read_bookmark_pairs())
+
+    def _write_async(self, mode, data):
+        """
+        Queues a bookmarks-file write on the single-threaded writer pool,
+        so mutations hit the disk in order without blocking the UI.
+        """
+        self._write_pool.start(BookmarkWriter(mode, data))
 
     def add_bookmark(self, name, url):
         """
         Adds a new bookmark to the file, checking for duplicates.
         """
-        bookmarks_file_path = os.path.join(get_data_path(), "bookmarks.txt")
-        existing_urls = []
-        try:
-            with open(bookmarks_file_path, "r") as f:
-                for line in f:
-                    parts = line.strip().split("|||")
-                    if len(parts) == 2:
-                        existing_urls.append(parts[1])
-        except FileNotFoundError:
-            pass
-
-        if url not in existing_urls:
-            with open(bookmarks_file_path, "a") as f:
-                f.write(f"{name}|||{url}\n")
-            self.load_bookmarks()
-        else:
+        if not self.add_bookmarks([(name, url)]):
             QMessageBox.warning(self, "Bookmark Exists", "This URL is already bookmarked.")
 
+    def add_bookmarks(self, pairs):
+        """
+        Adds several (name, url) bookmarks at once, skipping URLs that are
+        already bookmarked. The file is opened and appended to a single
+        time, which matters for bulk imports. Returns the list of pairs
+        that were actually written.
+        """
+        self._ensure_loaded()
+        # Validate the whole batch against the URL set before touching the
+        # disk; `seen` starts as a copy so duplicates within the batch
+        # itself are also rejected, all in linear time.
+        new_pairs = []
+        seen = set(self._url_set)
+        for name, url in pairs:
+            if url not in seen:
+                new_pairs.append((name, url))
+                seen.add(url)
+        if new_pairs:
+            self._write_async("a", "".join(f"{name}|||{url}\n" for name, url in new_pairs))
+            # Append only the new rows rather than resetting the model
+            self.model.append_bookmarks(new_pairs)
+            self._url_set.update(url for _, url in new_pairs)
+        return new_pairs
+
     def open_bookmark(self):
         """
         Opens the selected bookmark in a new tab of the main browser window.
         """
-        selected_item = self.bookmark_list.currentItem()
-        if selected_item:
-            url = selected_item.data(Qt.UserRole)
-            self.parent().add_new_tab(QUrl(url), selected_item.text())
+        index = self.bookmark_list.currentIndex()
+        if index.isValid():
+            url = index.data(Qt.UserRole)
+            self.parent().add_new_tab(QUrl(url), index.data(Qt.DisplayRole))
             self.accept()
 
     def delete_bookmark(self):
         """
-        Deletes the selected bookmark from the file and reloads the list.
+        Deletes the selected bookmark from the model, rewrites the file
+        from memory in a single pass, and removes just that row from the
+        view.
         """
-        selected_item = self.bookmark_list.currentItem()
-        if selected_item:
+        self._ensure_loaded()
+        index = self.bookmark_list.currentIndex()
+        if index.isValid():
             reply = QMessageBox.question(self, 'Delete Bookmark', 'Are you sure you want to delete this bookmark?',
                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                url_to_delete = selected_item.data(Qt.UserRole)
-                bookmarks_to_keep = []
-                bookmarks_file_path = os.path.join(get_data_path(), "bookmarks.txt")
-                try:
-                    with open(bookmarks_file_path, "r") as f:
-                        for line in f:
-                            parts = line.strip().split("|||")
-                            if len(parts) == 2 and parts[1] != url_to_delete:
-                                bookmarks_to_keep.append(line)
-                    with open(bookmarks_file_path, "w") as f:
-                        for bookmark_line in bookmarks_to_keep:
-                            f.write(bookmark_line)
-                except FileNotFoundError:
-                    pass
-                self.load_bookmarks()
+                url_to_delete = index.data(Qt.UserRole)
+                # The view shows proxy rows; map back to the source model
+                self.model.remove_row(self.proxy.mapToSource(index).row())
+                self._url_set.discard(url_to_delete)
+                self._write_async("w", "".join(f"{name}|||{url}\n" for name, url in self.model.bookmarks()))
 
 
 # --- Main Browser Window Class ---
 class Browser(QMainWindow):
+    # Custom user-agent string to prevent websites from blocking or
+    # serving a non-optimal page due to an unrecognized browser. This
+    # provides better compatibility and a more consistent browsing
+    # experience.
+    _USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36 MyAdvancedBrowser/1.0"
+
     def __init__(self):
         super(Browser, self).__init__()
         self.setObjectName("BrowserWindow")
@@ -163,6 +409,10 @@ class Browser(QMainWindow):
         self.setCentralWidget(self.tabs)
         self.showMaximized()
 
+        # The default profile is shared by every tab, so set the
+        # user-agent once here instead of re-applying it per tab.
+        QWebEngineProfile.defaultProfile().setHttpUserAgent(self._USER_AGENT)
+
         navbar = QToolBar()
         navbar.setObjectName("BrowserToolbar")
         navbar.setIconSize(QSize(24, 24))
@@ -177,26 +427,33 @@ class Browser(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
 
+        # loadProgress can fire many times per second; coalesce the
+        # resulting UI refreshes through a short single-shot timer so the
+        # widgets update at most ~30 times per second.
+        self._pending_browser = None
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(33)
+        self._ui_update_timer.timeout.connect(self._flush_browser_ui)
+
         self.setup_toolbar_actions(navbar)
 
         # Set DuckDuckGo as default homepage
         self.add_new_tab(QUrl("https://duckduckgo.com/"), "Homepage")
 
-        self.bookmark_manager = BookmarkManager(self)
+        # Created lazily on first use so startup doesn't pay for opening
+        # and parsing the bookmarks file.
+        self.bookmark_manager = None
         self._update_close_button_visibility()
 
-    def _get_user_agent(self):
-        """
-        Returns a custom user-agent string to prevent websites from
-        blocking or serving a non-optimal page due to an unrecognized browser.
-        This provides better compatibility and a more consistent browsing experience.
-        """
-        return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36 MyAdvancedBrowser/1.0"
-
-    def _get_icon(self, icon_name, fallback_text):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_icon(icon_name, fallback_text):
         """
         Helper function to get an icon from the theme, or return a text label as a fallback.
         This prevents the app from having blank buttons if the icon theme is missing.
+        Results are cached so each theme lookup (a filesystem walk) runs
+        only once per icon name.
         """
         # Try to get the icon from the system theme
         icon = QIcon.fromTheme(icon_name)
@@ -283,51 +540,89 @@ class Browser(QMainWindow):
             qurl = QUrl("https://duckduckgo.com/")
 
         browser = QWebEngineView()
-        
-        # Set a custom user-agent for the new page
-        browser.page().profile().setHttpUserAgent(self._get_user_agent())
-
         browser.setUrl(qurl)
         i = self.tabs.addTab(browser, label)
         self.tabs.setCurrentIndex(i)
 
-        browser.urlChanged.connect(lambda q: self._update_browser_ui(browser))
-        browser.loadProgress.connect(lambda p: self._update_browser_ui(browser))
-        browser.loadFinished.connect(lambda s: self._update_browser_ui(browser))
-        browser.titleChanged.connect(lambda t: self.update_tab_title(t, browser))
-        browser.iconUrlChanged.connect(lambda u: self.update_tab_icon(u, browser))
+        # Connect bound methods rather than per-tab lambdas; loadProgress
+        # in particular fires continuously during a load, and closures add
+        # an extra Python frame to every tick. The slots recover the
+        # emitting tab via sender().
+        browser.urlChanged.connect(self._on_url_changed)
+        browser.loadProgress.connect(self._on_load_progress)
+        browser.loadFinished.connect(self._on_load_finished)
+        browser.titleChanged.connect(self._on_title_changed)
+        browser.iconUrlChanged.connect(self._on_icon_url_changed)
         browser.page().profile().downloadRequested.connect(self.on_download_requested)
-        browser.loadStarted.connect(lambda: self.set_status_message(f"Loading {browser.url().host()}"))
+        browser.loadStarted.connect(self._on_load_started)
 
         self._update_close_button_visibility()
         self._update_browser_ui(browser)
         self.update_tab_title(label, browser)
 
+    def _on_url_changed(self, qurl):
+        self._update_browser_ui(self.sender())
+
+    def _on_load_progress(self, progress):
+        self._update_browser_ui(self.sender())
+
+    def _on_load_finished(self, ok):
+        self._update_browser_ui(self.sender())
+
+    def _on_title_changed(self, title):
+        self.update_tab_title(title, self.sender())
+
+    def _on_icon_url_changed(self, url):
+        self.update_tab_icon(url, self.sender())
+
+    def _on_load_started(self):
+        self.set_status_message(f"Loading {self.sender().url().host()}")
+
     def _update_browser_ui(self, browser):
         """
-        A helper function to update the UI elements based on the current browser tab state.
-        This centralizes logic and avoids repetition.
+        Schedules a UI refresh for the given browser tab. Bursts of signal
+        activity (especially loadProgress) are coalesced by the timer so
+        only the latest state is actually painted.
         """
         if browser != self.current_browser():
             return
+        self._pending_browser = browser
+        if not self._ui_update_timer.isActive():
+            self._ui_update_timer.start()
+
+    def _flush_browser_ui(self):
+        """
+        Performs the actual widget updates for the last scheduled tab.
+        This centralizes logic and avoids repetition.
+        """
+        browser = self._pending_browser
+        self._pending_browser = None
+        if browser is None or browser != self.current_browser():
+            return
 
         qurl = browser.url()
         progress = browser.loadProgress()
         title = browser.page().title()
-        
-        # Update URL bar
-        self.url_bar.setText(qurl.toDisplayString())
-        self.url_bar.setCursorPosition(0)
-        
-        # Update progress bar and status bar
+
+        # Update the URL bar only when the text actually changed;
+        # setText moves the cursor and forces a repaint.
+        url_text = qurl.toDisplayString()
+        if self.url_bar.text() != url_text:
+            self.url_bar.setText(url_text)
+            self.url_bar.setCursorPosition(0)
+
+        # Update progress bar and status bar, skipping no-op writes
         if progress < 100:
-            self.progress_bar.setValue(progress)
-            self.progress_bar.setVisible(True)
+            if self.progress_bar.value() != progress:
+                self.progress_bar.setValue(progress)
+            if not self.progress_bar.isVisible():
+                self.progress_bar.setVisible(True)
             self.set_status_message(f"Loading... {progress}%")
         else:
-            self.progress_bar.setVisible(False)
-            self.set_status_message(qurl.toDisplayString())
-        
+            if self.progress_bar.isVisible():
+                self.progress_bar.setVisible(False)
+            self.set_status_message(url_text)
+
         # Update the main window title
         self.update_tab_title(title, browser)
         
@@ -419,9 +714,14 @@ class Browser(QMainWindow):
             return
         index = self.tabs.indexOf(browser)
         display_title = title if title else "New Tab"
-        self.tabs.setTabText(index, display_title)
+        # Titles churn during page loads; only touch the widgets when the
+        # text really changed to avoid redundant repaints.
+        if self.tabs.tabText(index) != display_title:
+            self.tabs.setTabText(index, display_title)
         if browser == self.current_browser():
-            self.setWindowTitle(f"My Advanced Browser - {display_title}")
+            window_title = f"My Advanced Browser - {display_title}"
+            if self.windowTitle() != window_title:
+                self.setWindowTitle(window_title)
 
     def update_tab_icon(self, url, browser):
         """
@@ -430,9 +730,10 @@ class Browser(QMainWindow):
         index = self.tabs.indexOf(browser)
         if index != -1:
             if url.isValid():
-                browser.page().icon().pixmap(QSize(16, 16)).save("temp_icon.png")
-                self.tabs.setTabIcon(index, QIcon("temp_icon.png"))
-                os.remove("temp_icon.png")
+                # Build the QIcon straight from the pixmap; no need to
+                # round-trip the favicon through a temporary PNG on disk.
+                pixmap = browser.page().icon().pixmap(QSize(16, 16))
+                self.tabs.setTabIcon(index, QIcon(pixmap))
             else:
                 # Fallback to a default icon or no icon if not available
                 self.tabs.setTabIcon(index, QIcon())
@@ -453,6 +754,8 @@ class Browser(QMainWindow):
             # QMessageBox.getText returns a tuple of (text, bool)
             text, ok = QMessageBox.getText(self, 'Add Bookmark', 'Enter a name for this bookmark:', QLineEdit.Normal, title if title else current_url)
             if ok and text:
+                if self.bookmark_manager is None:
+                    self.bookmark_manager = BookmarkManager(self)
                 self.bookmark_manager.add_bookmark(text, current_url)
         else:
             QMessageBox.warning(self, "Cannot Add Bookmark", "Cannot add a bookmark for a blank or invalid page.")
@@ -461,6 +764,8 @@ class Browser(QMainWindow):
         """
         Displays the bookmark manager dialog.
         """
+        if self.bookmark_manager is None:
+            self.bookmark_manager = BookmarkManager(self)
         self.bookmark_manager.load_bookmarks()
         self.bookmark_manager.exec_()
 
@@ -499,33 +804,11 @@ class Browser(QMainWindow):
         """
         Shows an 'About' dialog with application information.
         """
-        now = datetime.datetime.now()
-        current_time_str = now.strftime("%I:%M:%S %p")
-        current_date = now.strftime("%B %d, %Y")
-        timezone = now.astimezone().tzname()
-        
-        info_text = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: sans-serif; background-color: #333; color: #eee; }}
-                h3 {{ color: #007bff; }}
-                p {{ margin: 5px 0; }}
-                b {{ color: #ccc; }}
-            </style>
-        </head>
-        <body>
-            <h3>My Advanced Browser</h3>
-            <p>Version: 1.0.0</p>
-            <p>A simple, functional web browser built with PyQt5 and QtWebEngine.</p>
-            <p><b>Current Time:</b> {current_time_str} {timezone}</p>
-            <p><b>Current Date:</b> {current_date}</p>
-            <p><b>System:</b> {sys.platform}</p>
-            <p><b>Python Version:</b> {sys.version.split()[0]}</p>
-            <p><b>Qt Version:</b> {QT_VERSION_STR}</p>
-        </body>
-        </html>
-        """
+        now = datetime.datetime.now().astimezone()
+        # A single strftime call formats both clock fields; they are split
+        # apart afterwards for the template.
+        current_time_str, _, current_date = now.strftime("%I:%M:%S %p|%B %d, %Y").partition("|")
+        info_text = _ABOUT_TEMPLATE.format(time=current_time_str, tz=now.tzname(), date=current_date)
         QMessageBox.about(self, "About My Advanced Browser", info_text)
 
 
@@ -534,156 +817,9 @@ if __name__ == "__main__":
     QApplication.setApplicationName("My Advanced Browser")
 
     # This stylesheet provides a modern, dark theme for the browser.
-    app.setStyleSheet("""
-        QMainWindow#BrowserWindow {
-            background-color: #333;
-            color: #eee;
-        }
-
-        QToolBar#BrowserToolbar {
-            background-color: #222;
-            border: none;
-            padding: 5px;
-            spacing: 10px;
-        }
-
-        QToolBar QAction {
-            font-size: 14px;
-            color: #ccc;
-            padding: 5px 10px;
-        }
-
-        QToolBar QAction:hover {
-            background-color: #444;
-            border-radius: 3px;
-        }
-
-        QToolBar QAction::icon {
-            background-color: transparent;
-        }
-
-        QLineEdit#UrlBar {
-            border: 1px solid #555;
-            border-radius: 8px;
-            padding: 5px 10px;
-            background-color: #444;
-            color: #eee;
-            selection-background-color: #007bff;
-            font-size: 14px;
-            margin-left: 10px;
-            margin-right: 10px;
-        }
-
-        QTabWidget::pane {
-            border-top: 1px solid #444;
-            background-color: #1e1e1e;
-        }
-
-        QTabBar::tab {
-            background: #444;
-            border: 1px solid #555;
-            border-bottom-color: #444;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-            padding: 8px 15px;
-            margin-right: 2px;
-            color: #ccc;
-            font-size: 13px;
-        }
-
-        QTabBar::tab:selected {
-            background: #1e1e1e;
-            border-bottom-color: #1e1e1e;
-            color: #fff;
-            font-weight: bold;
-        }
-
-        QTabBar::tab:hover:!selected {
-            background: #555;
-        }
-
-        QStatusBar {
-            background-color: #222;
-            color: #ccc;
-            border-top: 1px solid #444;
-            padding: 2px;
-        }
-
-        QStatusBar QLabel {
-            color: #ccc;
-        }
-
-        QProgressBar {
-            border: 1px solid #555;
-            border-radius: 5px;
-            text-align: center;
-            background-color: #444;
-            color: #eee;
-        }
-
-        QProgressBar::chunk {
-            background-color: #007bff;
-            border-radius: 5px;
-        }
-
-        QDialog#BookmarkManager {
-            background-color: #333;
-            border: 1px solid #555;
-            border-radius: 5px;
-        }
-
-        QListWidget#BookmarkList {
-            background-color: #2a2a2a;
-            border: 1px solid #444;
-            border-radius: 5px;
-            color: #eee;
-            padding: 5px;
-        }
-
-        QListWidget::item {
-            padding: 5px;
-        }
-
-        QListWidget::item:selected {
-            background-color: #007bff;
-            color: #fff;
-        }
-
-        QPushButton#BookmarkButton {
-            background-color: #007bff;
-            color: white;
-            border: none;
-            padding: 8px 15px;
-            border-radius: 5px;
-            font-size: 14px;
-            margin: 5px;
-        }
-
-        QPushButton#BookmarkButton:hover {
-            background-color: #0056b3;
-        }
-
-        QMessageBox {
-            background-color: #333;
-            color: #eee;
-        }
-
-        QMessageBox QLabel {
-            color: #eee;
-        }
-
-        QMessageBox QPushButton {
-            background-color: #007bff;
-            color: white;
-            border: none;
-            padding: 5px 10px;
-            border-radius: 3px;
-        }
-
-        QMessageBox QPushButton:hover {
-            background-color: #0056b3;
-        }
-    """)
+    # The dark theme lives in styles.qss next to this script; reading it
+    # from disk keeps the multi-KB stylesheet out of the module source.
+    app.setStyleSheet(load_stylesheet())
 
     window = Browser()
     sys.exit(app.exec_())